@@ -0,0 +1,35 @@
+"""
+Record type for a single clipboard history entry.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ClipboardItem:
+    """
+    A clipboard history entry.
+    
+    Uses __slots__ so each item carries no per-instance __dict__; loading
+    the history creates one for every stored row.
+    
+    Attributes:
+        type (str): Category label from ContentCategorizer
+        content (str): The copied text
+        time (str): Display time, e.g. "03:15 PM"
+        timestamp (str): ISO 8601 timestamp of the copy
+        char_count (int): Length of the content in characters
+        content_lower (str): Lowercased content, cached for searching
+    """
+    
+    __slots__ = ("type", "content", "time", "timestamp", "char_count", "content_lower")
+    
+    type: str
+    content: str
+    time: str
+    timestamp: str
+    char_count: int
+    
+    def __post_init__(self):
+        """Cache the lowercased content (not a dataclass field)."""
+        self.content_lower = self.content.lower()
\ No newline at end of file
@@ -3,12 +3,14 @@ Clipboard monitoring functionality.
 """
 
 import os
-import time
-import threading
 import datetime
-import pyperclip
+import hashlib
+from collections import OrderedDict
+
+from PyQt5.QtGui import QGuiApplication
 
 from ..utils.categorizer import ContentCategorizer
+from .clipboard_item import ClipboardItem
 
 
 class ClipboardMonitor:
@@ -16,6 +18,11 @@ class ClipboardMonitor:
     Monitors clipboard for new content and emits signals when content changes.
     """
     
+    # Number of recent distinct entries remembered for deduplication
+    MAX_SEEN_ENTRIES = 256
+    # Number of content digests whose category is remembered
+    MAX_CACHED_CATEGORIES = 1024
+    
     def __init__(self, signals):
         """
         Initialize the clipboard monitor.
@@ -25,59 +32,113 @@ class ClipboardMonitor:
         """
         self.signals = signals
         self.monitoring_active = False
-        self.monitor_thread = None
+        self.clipboard = None
+        # Digests of recently seen content, oldest first
+        self.seen_entries = OrderedDict()
+        # Digest -> category, so re-copying older content skips categorization
+        self.category_cache = OrderedDict()
         self.categorizer = ContentCategorizer()
     
     def start_monitoring(self):
-        """Start clipboard monitoring in a separate thread."""
+        """
+        Start listening for clipboard changes.
+        
+        Uses the QClipboard.dataChanged notification, so no work is done while
+        the clipboard is idle. Must be called from the GUI thread once the
+        QApplication exists.
+        """
         if not self.monitoring_active:
+            # Create logs directory if it doesn't exist
+            if not os.path.exists("clipboard_logs"):
+                os.makedirs("clipboard_logs")
+            
             self.monitoring_active = True
-            self.monitor_thread = threading.Thread(target=self._monitor_clipboard)
-            self.monitor_thread.daemon = True
-            self.monitor_thread.start()
+            self.clipboard = QGuiApplication.clipboard()
+            self.seen_entries.clear()
+            self._remember(self._content_key(self.clipboard.text()))
+            self.clipboard.dataChanged.connect(self._on_clipboard_changed)
     
     def stop_monitoring(self):
         """Stop clipboard monitoring."""
-        self.monitoring_active = False
+        if self.monitoring_active:
+            self.monitoring_active = False
+            self.clipboard.dataChanged.disconnect(self._on_clipboard_changed)
     
-    def _monitor_clipboard(self):
+    def _on_clipboard_changed(self):
         """
-        Internal method that runs in a separate thread to monitor clipboard changes.
+        Handle a clipboard change notification on the GUI thread.
         """
-        # Create logs directory if it doesn't exist
-        if not os.path.exists("clipboard_logs"):
-            os.makedirs("clipboard_logs")
-        
-        previous_content = pyperclip.paste()
-        seen_entries = {previous_content}
-        
-        while self.monitoring_active:
-            try:
-                current_content = pyperclip.paste()
+        try:
+            current_content = self.clipboard.text()
+            content_key = self._content_key(current_content)
+            
+            if content_key not in self.seen_entries:
+                
+                timestamp = datetime.datetime.now()
+                formatted_time = timestamp.strftime("%I:%M %p")
                 
-                if (current_content != previous_content and 
-                    current_content not in seen_entries):
-                    
-                    timestamp = datetime.datetime.now()
-                    formatted_time = timestamp.strftime("%I:%M %p")
-                    
-                    content_type = self.categorizer.categorize_content(current_content)
-                    
-                    item = {
-                        "type": content_type,
-                        "content": current_content,
-                        "time": formatted_time,
-                        "timestamp": timestamp.isoformat(),
-                        "chars": f"{len(current_content)} characters"
-                    }
-                    
-                    self.signals.new_clipboard_content.emit(item)
-                    
-                    previous_content = current_content
-                    seen_entries.add(current_content)
+                content_type = self._categorize(current_content, content_key)
                 
-                time.sleep(0.5)
+                item = ClipboardItem(
+                    type=content_type,
+                    content=current_content,
+                    time=formatted_time,
+                    timestamp=timestamp.isoformat(),
+                    char_count=len(current_content)
+                )
                 
-            except Exception as e:
-                print(f"Error in clipboard monitoring: {e}")
-                time.sleep(1) 
\ No newline at end of file
+                self.signals.new_clipboard_content.emit(item)
+                
+                self._remember(content_key)
+        
+        except Exception as e:
+            print(f"Error in clipboard monitoring: {e}")
+    
+    def _categorize(self, content, content_key):
+        """
+        Categorize content, reusing the result for content seen before.
+        
+        Args:
+            content (str): Clipboard text
+            content_key (bytes): Digest of content from _content_key
+            
+        Returns:
+            str: The category label
+        """
+        content_type = self.category_cache.get(content_key)
+        if content_type is not None:
+            self.category_cache.move_to_end(content_key)
+            return content_type
+        
+        content_type = self.categorizer.categorize_content(content)
+        
+        self.category_cache[content_key] = content_type
+        if len(self.category_cache) > self.MAX_CACHED_CATEGORIES:
+            self.category_cache.popitem(last=False)
+        return content_type
+    
+    def _remember(self, content_key):
+        """
+        Record a content digest, evicting the oldest beyond MAX_SEEN_ENTRIES.
+        
+        Args:
+            content_key (bytes): Digest from _content_key
+        """
+        self.seen_entries[content_key] = None
+        if len(self.seen_entries) > self.MAX_SEEN_ENTRIES:
+            self.seen_entries.popitem(last=False)
+    
+    @staticmethod
+    def _content_key(content):
+        """
+        Return a small fixed-size digest identifying clipboard content, so
+        large copies aren't kept alive just for deduplication.
+        
+        Args:
+            content (str): Clipboard text
+            
+        Returns:
+            bytes: 8-byte BLAKE2b digest of the content
+        """
+        return hashlib.blake2b(content.encode("utf-8", "surrogatepass"),
+                               digest_size=8).digest()
\ No newline at end of file
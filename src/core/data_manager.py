@@ -3,15 +3,56 @@ Data management for clipboard history persistence using SQLite.
 """
 
 import sqlite3
-import json
-import os
-from datetime import datetime
-from typing import List, Dict, Optional
+import threading
+from typing import Iterator, List, Optional, Tuple
+
+from .clipboard_item import ClipboardItem
 
 
 class ClipboardDataManager:
     """
     Handles loading and saving clipboard data to/from SQLite database.
+    
+    New items can be queued with queue_clipboard_item; a background writer
+    thread inserts them in batches every FLUSH_INTERVAL seconds so the GUI
+    thread never waits on disk I/O for a clipboard event. A flush is also
+    triggered early once FLUSH_BATCH_SIZE items are waiting, which bounds
+    how much a burst of copies can leave unsaved.
+    """
+    
+    # Seconds between background flushes of queued items
+    FLUSH_INTERVAL = 2.0
+    # Number of queued items that triggers a flush before the interval is up
+    FLUSH_BATCH_SIZE = 50
+    # Number of rows read per query by iter_clipboard_data
+    ITER_BATCH_SIZE = 256
+    
+    # Statements are kept as fixed strings so the connection's statement cache
+    # reuses the compiled statements instead of re-parsing them on every call
+    _INSERT_SQL = """
+        INSERT INTO clipboard_items (content, type, timestamp, time_formatted, char_count)
+        VALUES (?, ?, ?, ?, ?)
+    """
+    # id is assigned by the same insert that stamps created_at, so it orders
+    # rows the same way and lets each page seek straight to its first row
+    _PAGE_SQL = """
+        SELECT id, content, type, timestamp, time_formatted, char_count
+        FROM clipboard_items 
+        WHERE id < ?
+        ORDER BY id DESC
+        LIMIT ?
+    """
+    _SEARCH_SQL = """
+        SELECT content, type, timestamp, time_formatted, char_count
+        FROM clipboard_items 
+        WHERE content LIKE ?
+        ORDER BY created_at DESC, id DESC
+    """
+    _FILTER_SQL = """
+        SELECT content, type, timestamp, time_formatted, char_count
+        FROM clipboard_items 
+        WHERE type = ?
+        ORDER BY created_at DESC, id DESC
     """
     
     def __init__(self, db_file="clipboard_data.db"):
@@ -22,11 +63,45 @@ class ClipboardDataManager:
             db_file (str): Path to the SQLite database file
         """
         self.db_file = db_file
+        # One connection shared by the GUI and the writer thread. The lock
+        # serializes all use of it, and also keeps a flush in progress from
+        # re-inserting items after a clear.
+        self._conn = self._connect()
+        self._db_lock = threading.Lock()
         self.init_database()
+        
+        self._pending_items = []
+        self._pending_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._writer_thread = threading.Thread(target=self._writer_loop)
+        self._writer_thread.daemon = True
+        self._writer_thread.start()
+    
+    def _connect(self):
+        """
+        Open the connection to the database and set its pragmas.
+        
+        Returns:
+            sqlite3.Connection: Connection to db_file, usable from any thread
+                while holding _db_lock
+        """
+        conn = sqlite3.connect(self.db_file, check_same_thread=False,
+                               cached_statements=128)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        # With WAL, synchronous=NORMAL only syncs at checkpoints and stays
+        # crash-safe
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-20000")
+        return conn
     
     def init_database(self):
         """Initialize the database and create tables if they don't exist."""
-        with sqlite3.connect(self.db_file) as conn:
+        with self._db_lock, self._conn as conn:
+            # The journal mode is stored in the database file, so set it once here
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS clipboard_items (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -39,42 +114,124 @@ class ClipboardDataManager:
                 )
             """)
             
-            # Create indexes for better performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_type ON clipboard_items(type)")
+            # Create indexes for better performance. Newest-first queries walk
+            # these in order instead of sorting; id breaks ties between items
+            # saved within the same second.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_created ON clipboard_items(created_at DESC, id DESC)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_type_created ON clipboard_items(type, created_at DESC, id DESC)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON clipboard_items(timestamp)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_content ON clipboard_items(content)")
+            # Superseded by idx_type_created, and an index on content can't
+            # serve LIKE '%term%' searches
+            conn.execute("DROP INDEX IF EXISTS idx_type")
+            conn.execute("DROP INDEX IF EXISTS idx_content")
             
             conn.commit()
     
-    def save_clipboard_item(self, item: Dict) -> bool:
+    def save_clipboard_item(self, item: ClipboardItem) -> bool:
         """
         Save a single clipboard item to the database.
         
         Args:
-            item (dict): Clipboard item with keys: type, content, time, timestamp, chars
+            item (ClipboardItem): Clipboard item to save
             
         Returns:
             bool: True if saved successfully, False otherwise
         """
-        try:
-            with sqlite3.connect(self.db_file) as conn:
-                conn.execute("""
-                    INSERT INTO clipboard_items (content, type, timestamp, time_formatted, char_count)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    item["content"],
-                    item["type"],
-                    item["timestamp"],
-                    item["time"],
-                    len(item["content"])
-                ))
-                conn.commit()
+        with self._db_lock:
+            try:
+                with self._conn as conn:
+                    conn.execute(self._INSERT_SQL, (
+                        item.content,
+                        item.type,
+                        item.timestamp,
+                        item.time,
+                        item.char_count
+                    ))
+                    conn.commit()
+                    return True
+            except Exception as e:
+                print(f"Error saving clipboard item: {e}")
+                return False
+    
+    def queue_clipboard_item(self, item: ClipboardItem):
+        """
+        Queue a clipboard item to be saved by the background writer.
+        
+        Args:
+            item (ClipboardItem): Clipboard item to save
+        """
+        with self._pending_lock:
+            self._pending_items.append(item)
+            if len(self._pending_items) >= self.FLUSH_BATCH_SIZE:
+                self._wake_event.set()
+    
+    def flush(self) -> bool:
+        """
+        Write all queued clipboard items to the database in one transaction.
+        
+        Returns:
+            bool: True if the queue was written (or empty), False otherwise
+        """
+        with self._db_lock:
+            with self._pending_lock:
+                items, self._pending_items = self._pending_items, []
+            if not items:
                 return True
-        except Exception as e:
-            print(f"Error saving clipboard item: {e}")
-            return False
+            
+            try:
+                with self._conn as conn:
+                    conn.executemany(self._INSERT_SQL, [
+                        (
+                            item.content,
+                            item.type,
+                            item.timestamp,
+                            item.time,
+                            item.char_count
+                        )
+                        for item in items
+                    ])
+                    conn.commit()
+                    return True
+            except Exception as e:
+                print(f"Error flushing clipboard items: {e}")
+                return False
+    
+    def close(self):
+        """
+        Stop the background writer, write any queued items and close the
+        database.
+        
+        Before closing, SQLite refreshes planner statistics for tables whose
+        contents have shifted, and the WAL is checkpointed and truncated so
+        it doesn't keep growing across sessions. Calling close again does
+        nothing.
+        """
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+        self._wake_event.set()
+        self._writer_thread.join()
+        self.flush()
+        with self._db_lock:
+            try:
+                self._conn.execute("PRAGMA optimize")
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except Exception as e:
+                print(f"Error optimizing database: {e}")
+            self._conn.close()
     
-    def load_clipboard_data(self, limit: Optional[int] = None) -> List[Dict]:
+    def _writer_loop(self):
+        """
+        Internal method that runs in a separate thread to flush queued items.
+        """
+        while not self._stop_event.is_set():
+            self._wake_event.wait(self.FLUSH_INTERVAL)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                break
+            self.flush()
+    
+    def load_clipboard_data(self, limit: Optional[int] = None) -> List[ClipboardItem]:
         """
         Load clipboard history from database.
         
@@ -84,37 +241,81 @@ class ClipboardDataManager:
         Returns:
             list: List of clipboard items, ordered by most recent first
         """
+        return list(self.iter_clipboard_data(limit))
+    
+    def iter_clipboard_data(self, limit: Optional[int] = None) -> Iterator[ClipboardItem]:
+        """
+        Yield clipboard history lazily, most recent first.
+        
+        Rows are read ITER_BATCH_SIZE at a time through load_clipboard_page,
+        so only one batch of rows is held at once and the first items are
+        available without fetching the whole history. The database lock is
+        only held while a batch is read, never across a yield.
+        
+        Args:
+            limit (int, optional): Maximum number of items to yield
+            
+        Yields:
+            ClipboardItem: The next clipboard item
+        """
+        remaining = limit or None
+        key = None
+        while remaining is None or remaining > 0:
+            batch_size = self.ITER_BATCH_SIZE
+            if remaining is not None:
+                batch_size = min(batch_size, remaining)
+                remaining -= batch_size
+            items, key = self.load_clipboard_page(batch_size, key)
+            yield from items
+            if key is None:
+                break
+    
+    def load_clipboard_page(self, limit: int, before: Optional[int] = None
+                            ) -> Tuple[List[ClipboardItem], Optional[int]]:
+        """
+        Load one page of clipboard history using keyset pagination.
+        
+        Each page continues from the id of the last row of the previous one
+        through the primary key, so later pages don't re-scan skipped rows
+        the way OFFSET would.
+        
+        Args:
+            limit (int): Maximum number of items in the page
+            before (int, optional): Key returned with the previous page, or
+                None for the most recent items
+            
+        Returns:
+            tuple: (items, key) where items are ordered most recent first and
+                key is passed as before to get the next page, or is None
+                when there are no more items
+        """
+        if limit <= 0:
+            return [], None
+        self.flush()
+        if before is None:
+            # Larger than any rowid SQLite assigns
+            before = 2 ** 63 - 1
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                conn.row_factory = sqlite3.Row  # Enable column access by name
-                
-                query = """
-                    SELECT content, type, timestamp, time_formatted, char_count
-                    FROM clipboard_items 
-                    ORDER BY created_at DESC
-                """
-                
-                if limit:
-                    query += f" LIMIT {limit}"
-                
-                cursor = conn.execute(query)
-                rows = cursor.fetchall()
+            with self._db_lock, self._conn as conn:
+                rows = conn.execute(self._PAGE_SQL, (before, limit)).fetchall()
                 
-                return [
-                    {
-                        "content": row["content"],
-                        "type": row["type"],
-                        "timestamp": row["timestamp"],
-                        "time": row["time_formatted"],
-                        "chars": f"{row['char_count']} characters"
-                    }
+                items = [
+                    ClipboardItem(
+                        content=row["content"],
+                        type=row["type"],
+                        timestamp=row["timestamp"],
+                        time=row["time_formatted"],
+                        char_count=row["char_count"]
+                    )
                     for row in rows
                 ]
+                key = rows[-1]["id"] if len(rows) == limit else None
+                return items, key
         except Exception as e:
-            print(f"Error loading clipboard data: {e}")
-            return []
+            print(f"Error loading clipboard page: {e}")
+            return [], None
     
-    def search_clipboard_items(self, search_term: str) -> List[Dict]:
+    def search_clipboard_items(self, search_term: str) -> List[ClipboardItem]:
         """
         Search clipboard items by content.
         
@@ -124,34 +325,28 @@ class ClipboardDataManager:
         Returns:
             list: List of matching clipboard items
         """
+        self.flush()
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                conn.row_factory = sqlite3.Row
-                
-                cursor = conn.execute("""
-                    SELECT content, type, timestamp, time_formatted, char_count
-                    FROM clipboard_items 
-                    WHERE content LIKE ?
-                    ORDER BY created_at DESC
-                """, (f"%{search_term}%",))
+            with self._db_lock, self._conn as conn:
+                cursor = conn.execute(self._SEARCH_SQL, (f"%{search_term}%",))
                 
                 rows = cursor.fetchall()
                 
                 return [
-                    {
-                        "content": row["content"],
-                        "type": row["type"],
-                        "timestamp": row["timestamp"],
-                        "time": row["time_formatted"],
-                        "chars": f"{row['char_count']} characters"
-                    }
+                    ClipboardItem(
+                        content=row["content"],
+                        type=row["type"],
+                        timestamp=row["timestamp"],
+                        time=row["time_formatted"],
+                        char_count=row["char_count"]
+                    )
                     for row in rows
                 ]
         except Exception as e:
             print(f"Error searching clipboard items: {e}")
             return []
     
-    def filter_by_type(self, content_type: str) -> List[Dict]:
+    def filter_by_type(self, content_type: str) -> List[ClipboardItem]:
         """
         Filter clipboard items by type.
         
@@ -161,27 +356,21 @@ class ClipboardDataManager:
         Returns:
             list: List of clipboard items of the specified type
         """
+        self.flush()
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                conn.row_factory = sqlite3.Row
-                
-                cursor = conn.execute("""
-                    SELECT content, type, timestamp, time_formatted, char_count
-                    FROM clipboard_items 
-                    WHERE type = ?
-                    ORDER BY created_at DESC
-                """, (content_type,))
+            with self._db_lock, self._conn as conn:
+                cursor = conn.execute(self._FILTER_SQL, (content_type,))
                 
                 rows = cursor.fetchall()
                 
                 return [
-                    {
-                        "content": row["content"],
-                        "type": row["type"],
-                        "timestamp": row["timestamp"],
-                        "time": row["time_formatted"],
-                        "chars": f"{row['char_count']} characters"
-                    }
+                    ClipboardItem(
+                        content=row["content"],
+                        type=row["type"],
+                        timestamp=row["timestamp"],
+                        time=row["time_formatted"],
+                        char_count=row["char_count"]
+                    )
                     for row in rows
                 ]
         except Exception as e:
@@ -195,14 +384,17 @@ class ClipboardDataManager:
         Returns:
             bool: True if cleared successfully, False otherwise
         """
-        try:
-            with sqlite3.connect(self.db_file) as conn:
-                conn.execute("DELETE FROM clipboard_items")
-                conn.commit()
-                return True
-        except Exception as e:
-            print(f"Error clearing clipboard items: {e}")
-            return False
+        with self._db_lock:
+            with self._pending_lock:
+                self._pending_items.clear()
+            try:
+                with self._conn as conn:
+                    conn.execute("DELETE FROM clipboard_items")
+                    conn.commit()
+                    return True
+            except Exception as e:
+                print(f"Error clearing clipboard items: {e}")
+                return False
     
     def get_item_count(self) -> int:
         """
@@ -211,40 +403,42 @@ class ClipboardDataManager:
         Returns:
             int: Number of items in the database
         """
+        self.flush()
         try:
-            with sqlite3.connect(self.db_file) as conn:
+            with self._db_lock, self._conn as conn:
                 cursor = conn.execute("SELECT COUNT(*) FROM clipboard_items")
                 return cursor.fetchone()[0]
         except Exception as e:
             print(f"Error getting item count: {e}")
             return 0
     
-    def save_clipboard_data(self, clipboard_items: List[Dict]):
+    def save_clipboard_data(self, clipboard_items: List[ClipboardItem]):
         """
         Legacy method for compatibility - saves all items (used for bulk operations).
         
         Args:
-            clipboard_items (list): List of clipboard items to save
+            clipboard_items (list): List of ClipboardItem objects to save
         """
-        # This could be used for bulk operations or migration
-        try:
-            with sqlite3.connect(self.db_file) as conn:
-                # Clear existing data first
-                conn.execute("DELETE FROM clipboard_items")
-                
-                # Insert all items
-                for item in clipboard_items:
-                    conn.execute("""
-                        INSERT INTO clipboard_items (content, type, timestamp, time_formatted, char_count)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (
-                        item["content"],
-                        item["type"],
-                        item["timestamp"],
-                        item["time"],
-                        len(item["content"])
+        # This could be used for bulk operations or migration. New clipboard
+        # items go through queue_clipboard_item instead.
+        with self._db_lock:
+            try:
+                with self._conn as conn:
+                    # Replace everything in one write transaction, so the whole
+                    # rewrite costs a single commit instead of one per row
+                    conn.execute("BEGIN IMMEDIATE")
+                    conn.execute("DELETE FROM clipboard_items")
+                    conn.executemany(self._INSERT_SQL, (
+                        (
+                            item.content,
+                            item.type,
+                            item.timestamp,
+                            item.time,
+                            item.char_count
+                        )
+                        for item in clipboard_items
                     ))
-                
-                conn.commit()
-        except Exception as e:
-            print(f"Error saving clipboard data: {e}")
\ No newline at end of file
+                    
+                    conn.commit()
+            except Exception as e:
+                print(f"Error saving clipboard data: {e}")
\ No newline at end of file
@@ -8,6 +8,6 @@ from PyQt5.QtCore import pyqtSignal, QObject
 class ClipboardSignals(QObject):
     """
     Signal class for clipboard events.
-    When emitted, this signal sends clipboard item info as a dictionary.
+    When emitted, this signal sends the new ClipboardItem.
     """
-    new_clipboard_content = pyqtSignal(dict) 
\ No newline at end of file
+    new_clipboard_content = pyqtSignal(object) 
\ No newline at end of file
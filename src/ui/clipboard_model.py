@@ -0,0 +1,340 @@
+"""
+Qt item models backing the clipboard history list view.
+"""
+
+from array import array
+
+from PyQt5.QtCore import (Qt, QAbstractListModel, QSortFilterProxyModel,
+                          QModelIndex)
+
+
+class ClipboardItemModel(QAbstractListModel):
+    """
+    List model over clipboard items, newest first.
+    
+    Items are stored in arrival order so that adding a new clipboard item is
+    an append; row 0 maps to the last stored item. A stored item keeps the
+    same storage index until older history is added with append_older_items.
+    
+    Fields are kept in parallel columns rather than as a list of items, and
+    types are stored as small integer ids into a table of type names, so
+    filtering scans compact arrays instead of dereferencing an object per row.
+    
+    Qt.DisplayRole returns at most PREVIEW_LENGTH characters so painting a
+    huge entry doesn't lay out all of its text; ContentRole returns the
+    full content.
+    """
+    
+    TypeRole = Qt.UserRole + 1
+    TimeRole = Qt.UserRole + 2
+    CharCountRole = Qt.UserRole + 3
+    SearchRole = Qt.UserRole + 4
+    ContentRole = Qt.UserRole + 5
+    
+    PREVIEW_LENGTH = 512
+    
+    def __init__(self, parent=None):
+        """
+        Initialize an empty clipboard item model.
+        
+        Args:
+            parent: Optional QObject parent
+        """
+        super().__init__(parent)
+        self._contents = []
+        self._contents_lower = []
+        self._type_ids = array("B")
+        self._times = []
+        self._char_counts = array("Q")
+        # Type names by id; ids stay valid for the lifetime of the model
+        self._type_names = []
+        self._type_lookup = {}
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of clipboard items (the model is flat)."""
+        if parent.isValid():
+            return 0
+        return len(self._contents)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Return the requested field of the item at the given index.
+        
+        Args:
+            index (QModelIndex): Row to look up
+            role (int): Qt.DisplayRole for the content preview, or one of the custom roles
+        
+        Returns:
+            The field value, or None for unknown roles or invalid indexes
+        """
+        if not index.isValid():
+            return None
+        i = self.storage_index(index.row())
+        if role == Qt.DisplayRole:
+            content = self._contents[i]
+            if len(content) <= self.PREVIEW_LENGTH:
+                return content
+            return content[:self.PREVIEW_LENGTH - 3] + "..."
+        if role == self.ContentRole:
+            return self._contents[i]
+        if role == self.TypeRole:
+            return self._type_names[self._type_ids[i]]
+        if role == self.TimeRole:
+            return self._times[i]
+        if role == self.CharCountRole:
+            return self._char_counts[i]
+        if role == self.SearchRole:
+            return self._contents_lower[i]
+        return None
+    
+    def storage_index(self, row):
+        """
+        Map a view row (newest first) to its index in arrival order.
+        
+        Args:
+            row (int): Model row
+        
+        Returns:
+            int: Index into the underlying item list
+        """
+        return len(self._contents) - 1 - row
+    
+    def stored_type_id(self, storage_index):
+        """
+        Return the type id of the item at a storage index.
+        
+        Args:
+            storage_index (int): Index into the underlying item columns
+        
+        Returns:
+            int: Id of the item's type, as returned by type_id
+        """
+        return self._type_ids[storage_index]
+    
+    def stored_search_text(self, storage_index):
+        """
+        Return the lowercased content of the item at a storage index.
+        
+        Args:
+            storage_index (int): Index into the underlying item columns
+        
+        Returns:
+            str: The item's content, lowercased for searching
+        """
+        return self._contents_lower[storage_index]
+    
+    def type_id(self, type_name):
+        """
+        Return the id for a type name, assigning a new one if needed.
+        
+        Args:
+            type_name (str): Content type label
+        
+        Returns:
+            int: Id used for the type in this model
+        """
+        type_id = self._type_lookup.get(type_name)
+        if type_id is None:
+            type_id = len(self._type_names)
+            self._type_names.append(type_name)
+            self._type_lookup[type_name] = type_id
+        return type_id
+    
+    def set_items(self, items):
+        """
+        Replace the model contents.
+        
+        Args:
+            items (list): ClipboardItem objects ordered most recent first, as
+                returned by ClipboardDataManager.load_clipboard_data
+        """
+        self.beginResetModel()
+        self._clear_columns()
+        for item in reversed(items):
+            self._append(item)
+        self.endResetModel()
+    
+    def prepend_item(self, item):
+        """
+        Add a new clipboard item at the top of the list.
+        
+        Args:
+            item (ClipboardItem): Clipboard item to add
+        """
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._append(item)
+        self.endInsertRows()
+    
+    def prepend_items(self, items):
+        """
+        Add several new clipboard items at the top of the list in one insert.
+        
+        Args:
+            items (list): ClipboardItem objects in arrival order (oldest first)
+        """
+        if not items:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(items) - 1)
+        for item in items:
+            self._append(item)
+        self.endInsertRows()
+    
+    def append_older_items(self, items):
+        """
+        Add items older than everything in the model at the bottom of the list.
+        
+        They are stored ahead of the existing items, so every existing
+        item's storage index shifts up by len(items).
+        
+        Args:
+            items (list): ClipboardItem objects ordered most recent first, as
+                returned by ClipboardDataManager.load_clipboard_page
+        """
+        if not items:
+            return
+        first = len(self._contents)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        items = items[::-1]
+        self._contents[0:0] = [item.content for item in items]
+        self._contents_lower[0:0] = [item.content_lower for item in items]
+        type_ids = array("B", [self.type_id(item.type) for item in items])
+        self._type_ids = type_ids + self._type_ids
+        self._times[0:0] = [item.time for item in items]
+        char_counts = array("Q", [item.char_count for item in items])
+        self._char_counts = char_counts + self._char_counts
+        self.endInsertRows()
+    
+    def clear(self):
+        """Remove all items from the model."""
+        self.beginResetModel()
+        self._clear_columns()
+        self.endResetModel()
+    
+    def _append(self, item):
+        """
+        Store an item's fields at the end of the columns.
+        
+        Args:
+            item (ClipboardItem): Clipboard item to store
+        """
+        self._contents.append(item.content)
+        self._contents_lower.append(item.content_lower)
+        self._type_ids.append(self.type_id(item.type))
+        self._times.append(item.time)
+        self._char_counts.append(item.char_count)
+    
+    def _clear_columns(self):
+        """Empty all item columns, keeping the type table."""
+        self._contents = []
+        self._contents_lower = []
+        self._type_ids = array("B")
+        self._times = []
+        self._char_counts = array("Q")
+
+
+class ClipboardFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters a ClipboardItemModel by content type and search text.
+    """
+    
+    def __init__(self, parent=None):
+        """
+        Initialize the proxy with no type or search filter applied.
+        
+        Args:
+            parent: Optional QObject parent
+        """
+        super().__init__(parent)
+        self._filter_type = "All"
+        # Source model's id for _filter_type, or None when showing all types
+        self._filter_type_id = None
+        self._search_text = ""
+        # Storage indices matching _search_text among the first _scanned
+        # stored items; later items are checked directly until the next search
+        self._search_matches = set()
+        self._scanned = 0
+    
+    def setSourceModel(self, model):
+        """Attach the source model and watch it for changes to its rows."""
+        super().setSourceModel(model)
+        model.rowsAboutToBeInserted.connect(self._on_rows_about_to_be_inserted)
+        model.modelAboutToBeReset.connect(self._reset_search_cache)
+    
+    def set_filter_type(self, filter_type):
+        """
+        Show only items of the given type.
+        
+        Args:
+            filter_type (str): Content type to show, or "All"
+        """
+        self._filter_type = filter_type
+        if filter_type == "All":
+            self._filter_type_id = None
+        else:
+            self._filter_type_id = self.sourceModel().type_id(filter_type)
+        self.invalidateFilter()
+    
+    def set_search_text(self, search_text):
+        """
+        Show only items whose content contains the given text.
+        
+        Args:
+            search_text (str): Case-insensitive text to search for
+        """
+        search_text = search_text.lower()
+        if not search_text:
+            self._search_text = ""
+            self._search_matches = set()
+            self.invalidateFilter()
+            return
+        model = self.sourceModel()
+        count = model.rowCount()
+        
+        # A query that extends the previous one can only match a subset of
+        # its results, plus items that arrived since, so narrow those instead
+        # of rescanning everything. Only the previous query's results are
+        # kept, so memory doesn't grow with the number of queries typed.
+        if self._search_text and search_text.startswith(self._search_text):
+            candidates = list(self._search_matches)
+            candidates.extend(range(self._scanned, count))
+        else:
+            candidates = range(count)
+        
+        self._search_text = search_text
+        self._search_matches = {i for i in candidates
+                                if search_text in model.stored_search_text(i)}
+        self._scanned = count
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        """
+        Decide whether a source row passes the type and search filters.
+        
+        Args:
+            source_row (int): Row in the source model
+            source_parent (QModelIndex): Parent index (unused, model is flat)
+        
+        Returns:
+            bool: True if the row should be shown
+        """
+        model = self.sourceModel()
+        storage_index = model.storage_index(source_row)
+        
+        if (self._filter_type_id is not None
+                and model.stored_type_id(storage_index) != self._filter_type_id):
+            return False
+        if not self._search_text:
+            return True
+        if storage_index < self._scanned:
+            return storage_index in self._search_matches
+        return self._search_text in model.stored_search_text(storage_index)
+    
+    def _on_rows_about_to_be_inserted(self, parent, first, last):
+        """Forget cached search results before older items shift storage indices."""
+        if first != 0:
+            self._reset_search_cache()
+    
+    def _reset_search_cache(self):
+        """Forget the previous search's results, e.g. before a model reset."""
+        self._search_matches = set()
+        self._scanned = 0
\ No newline at end of file
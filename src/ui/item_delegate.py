@@ -0,0 +1,203 @@
+"""
+Item delegate that paints clipboard entries in the history list view.
+"""
+
+from PyQt5.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt5.QtCore import Qt, QRect, QSize, QEvent
+from PyQt5.QtGui import (QColor, QFont, QFontMetrics, QGuiApplication,
+                         QPainter, QPixmap)
+
+from .clipboard_model import ClipboardItemModel
+
+
+class ClipboardItemDelegate(QStyledItemDelegate):
+    """
+    Paints each clipboard item directly with QPainter: a type glyph, the
+    wrapped content, a "Copy" button and a footer with type, time and size.
+    No child widgets are created per row.
+    
+    Content is clipped to MAX_CONTENT_LINES so every row has the same height,
+    which lets the view use uniform item sizes instead of measuring the text
+    of every item in the history.
+    """
+    
+    TYPE_GLYPHS = {"Code": "⌨", "LaTeX": "𝐄", "Quotes": "❝"}
+    DEFAULT_GLYPH = "≡"
+    
+    CARD_COLOR = QColor("#2d2d2d")
+    META_COLOR = QColor("#888")
+    COPY_HOVER_COLOR = QColor("#FFF")
+    COPY_HOVER_TEXT_COLOR = QColor("#333")
+    
+    MARGIN = 5
+    PADDING = 10
+    SPACING = 8
+    GLYPH_WIDTH = 40
+    COPY_WIDTH = 60
+    MAX_CONTENT_LINES = 3
+    
+    def __init__(self, parent=None):
+        """
+        Initialize the delegate and its fonts.
+        
+        Args:
+            parent: Optional QObject parent, normally the list view
+        """
+        super().__init__(parent)
+        self.content_font = QFont()
+        self.content_font.setPixelSize(16)
+        self.glyph_font = QFont()
+        self.glyph_font.setPixelSize(32)
+        self.meta_font = QFont()
+        
+        # Font measurements are fixed, so take them once rather than per paint
+        self._content_line_height = QFontMetrics(self.content_font).height()
+        self._glyph_height = QFontMetrics(self.glyph_font).height()
+        self._meta_height = QFontMetrics(self.meta_font).height()
+        content_height = max(
+            self.MAX_CONTENT_LINES * QFontMetrics(self.content_font).lineSpacing(),
+            self._glyph_height)
+        self._row_height = (2 * self.MARGIN + 2 * self.PADDING + content_height
+                            + self.SPACING + self._meta_height)
+        
+        # Type glyphs rendered once per (glyph, device pixel ratio)
+        self._glyph_pixmaps = {}
+    
+    def paint(self, painter, option, index):
+        """
+        Draw the clipboard item at the given index.
+        
+        Args:
+            painter (QPainter): Painter for the view's viewport
+            option (QStyleOptionViewItem): Geometry and state of the row
+            index (QModelIndex): Index of the item to draw
+        """
+        painter.save()
+        painter.setRenderHint(painter.Antialiasing)
+        
+        card = option.rect.adjusted(0, self.MARGIN, 0, -self.MARGIN)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.CARD_COLOR)
+        painter.drawRoundedRect(card, 8, 8)
+        
+        glyph_rect, content_rect, copy_rect, meta_rect = self._layout(card)
+        item_type = index.data(ClipboardItemModel.TypeRole)
+        
+        # Type glyph
+        ratio = option.widget.devicePixelRatioF() if option.widget is not None else 1.0
+        glyph = self.TYPE_GLYPHS.get(item_type, self.DEFAULT_GLYPH)
+        painter.drawPixmap(glyph_rect.topLeft(), self._glyph_pixmap(glyph, ratio))
+        
+        # Content
+        painter.setFont(self.content_font)
+        painter.setPen(option.palette.color(option.palette.Text))
+        painter.drawText(content_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap,
+                         index.data(Qt.DisplayRole))
+        
+        # Copy button, highlighted while the row is hovered
+        if option.state & QStyle.State_MouseOver:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.COPY_HOVER_COLOR)
+            painter.drawRoundedRect(copy_rect, 6, 6)
+            painter.setPen(self.COPY_HOVER_TEXT_COLOR)
+        painter.drawText(copy_rect, Qt.AlignCenter, "Copy")
+        
+        # Type, time and char length info
+        painter.setFont(self.meta_font)
+        painter.setPen(self.META_COLOR)
+        meta = "    ".join((item_type,
+                             index.data(ClipboardItemModel.TimeRole),
+                             f"{index.data(ClipboardItemModel.CharCountRole)} characters"))
+        painter.drawText(meta_rect, Qt.AlignLeft | Qt.AlignVCenter, meta)
+        
+        painter.restore()
+    
+    def sizeHint(self, option, index):
+        """
+        Return the size of a row. All rows share the same height.
+        
+        Args:
+            option (QStyleOptionViewItem): Geometry of the row
+            index (QModelIndex): Index of the item
+        
+        Returns:
+            QSize: Preferred size of the row
+        """
+        width = option.rect.width()
+        if width <= 0 and option.widget is not None:
+            width = option.widget.viewport().width()
+        return QSize(width, self._row_height)
+    
+    def editorEvent(self, event, model, option, index):
+        """
+        Copy the item's content when its "Copy" button is clicked.
+        
+        Args:
+            event (QEvent): Mouse or keyboard event on the row
+            model: Model the index belongs to
+            option (QStyleOptionViewItem): Geometry of the row
+            index (QModelIndex): Index of the item
+        
+        Returns:
+            bool: True if the event was handled
+        """
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton):
+            card = option.rect.adjusted(0, self.MARGIN, 0, -self.MARGIN)
+            copy_rect = self._layout(card)[2]
+            if copy_rect.contains(event.pos()):
+                QGuiApplication.clipboard().setText(
+                    index.data(ClipboardItemModel.ContentRole))
+                return True
+        return super().editorEvent(event, model, option, index)
+    
+    def _layout(self, card):
+        """
+        Split a card rectangle into the regions painted for an item.
+        
+        Args:
+            card (QRect): Rectangle of the item's card
+        
+        Returns:
+            tuple: (glyph_rect, content_rect, copy_rect, meta_rect)
+        """
+        inner = card.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+        meta_height = self._meta_height
+        top_height = max(inner.height() - meta_height - self.SPACING, 0)
+        
+        glyph_rect = QRect(inner.left(), inner.top(), self.GLYPH_WIDTH, top_height)
+        copy_rect = QRect(inner.right() - self.COPY_WIDTH + 1, inner.top(),
+                          self.COPY_WIDTH, self._content_line_height + 10)
+        content_left = glyph_rect.right() + 1 + self.SPACING
+        content_rect = QRect(content_left, inner.top(),
+                             copy_rect.left() - self.SPACING - content_left, top_height)
+        meta_rect = QRect(inner.left(), inner.bottom() - meta_height + 1,
+                          inner.width(), meta_height)
+        return glyph_rect, content_rect, copy_rect, meta_rect
+    
+    def _glyph_pixmap(self, glyph, ratio):
+        """
+        Return the type glyph pre-rendered into a pixmap, so painting a row
+        doesn't shape the glyph's text every time.
+        
+        Args:
+            glyph (str): The glyph character
+            ratio (float): Device pixel ratio of the view
+            
+        Returns:
+            QPixmap: Transparent pixmap with the glyph drawn in META_COLOR
+        """
+        key = (glyph, ratio)
+        pixmap = self._glyph_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(int(self.GLYPH_WIDTH * ratio), int(self._glyph_height * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setFont(self.glyph_font)
+            painter.setPen(self.META_COLOR)
+            painter.drawText(QRect(0, 0, self.GLYPH_WIDTH, self._glyph_height),
+                             Qt.AlignLeft | Qt.AlignTop, glyph)
+            painter.end()
+            self._glyph_pixmaps[key] = pixmap
+        return pixmap
\ No newline at end of file
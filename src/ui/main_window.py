@@ -3,9 +3,10 @@ Main window for the clipboard manager application.
 """
 
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QPushButton, QLabel, QLineEdit, QScrollArea, 
-                            QFrame, QMessageBox, QApplication)
-from PyQt5.QtCore import Qt
+                            QPushButton, QLabel, QLineEdit, QListView, 
+                            QFrame, QMessageBox, QApplication, QDialog,
+                            QPlainTextEdit, QDialogButtonBox)
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 
 from ..core.signals import ClipboardSignals
@@ -13,6 +14,8 @@ from ..core.clipboard_monitor import ClipboardMonitor
 from ..core.data_manager import ClipboardDataManager
 from .system_tray import ClipboardSystemTray
 from .components import UIComponents
+from .clipboard_model import ClipboardItemModel, ClipboardFilterProxyModel
+from .item_delegate import ClipboardItemDelegate
 
 
 class ClipboardManager(QMainWindow):
@@ -20,6 +23,11 @@ class ClipboardManager(QMainWindow):
     Main window for the entire clipboard manager application.
     """
     
+    # Longest line the full-content dialog will word-wrap
+    MAX_WRAPPED_LINE = 10000
+    # Number of stored items loaded into the list per event loop pass
+    HISTORY_BATCH_SIZE = 256
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Clipboard")
@@ -27,9 +35,22 @@ class ClipboardManager(QMainWindow):
         self.setStyleSheet("background-color: #1e1e1e; color: white;")
         
         # Initialize core components
-        self.clipboard_items = []
         self.data_manager = ClipboardDataManager("clipboard_data.db")
-        self.clipboard_items = self.data_manager.load_clipboard_data()
+        
+        # Clipboard history model, filtered by type and search text for display
+        self.model = ClipboardItemModel(self)
+        self.proxy_model = ClipboardFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.model)
+        
+        # Items copied while the window is hidden; added to the model on show
+        self._pending_items = []
+        
+        # Stored history is loaded a page at a time; _history_key is where the
+        # next page starts, or None once everything has been loaded
+        self._history_key = None
+        self._history_timer = QTimer(self)
+        self._history_timer.setInterval(0)
+        self._history_timer.timeout.connect(self._load_history_batch)
         
         # Initialize signals and monitoring
         self.signals = ClipboardSignals()
@@ -45,7 +66,8 @@ class ClipboardManager(QMainWindow):
         # Setup system tray
         self.system_tray = ClipboardSystemTray(self)
         
-        # Display existing clipboard items
+        # Load the most recent history now; older pages follow in batches
+        # from the event loop so the window stays responsive meanwhile
         self.display_clipboard_items()
         
         # Start clipboard monitoring
@@ -70,6 +92,7 @@ class ClipboardManager(QMainWindow):
         """Create and return the sidebar widget."""
         sidebar = QWidget()
         sidebar.setMaximumWidth(270)
+        sidebar.setStyleSheet(self.ui_components.SIDEBAR_STYLESHEET)
         sidebar_layout = QVBoxLayout(sidebar)
         
         # Title
@@ -84,12 +107,14 @@ class ClipboardManager(QMainWindow):
         self.plaintext_btn = self.ui_components.create_sidebar_button("Plaintext", "≡")
         self.misc_btn = self.ui_components.create_sidebar_button("Miscellaneous", "📄")
         
-        # Connect filter buttons
-        self.all_btn.clicked.connect(lambda: self.filter_items("All"))
-        self.code_math_btn.clicked.connect(lambda: self.filter_items("Code and Math"))
-        self.url_btn.clicked.connect(lambda: self.filter_items("URL"))
-        self.plaintext_btn.clicked.connect(lambda: self.filter_items("Plaintext"))
-        self.misc_btn.clicked.connect(lambda: self.filter_items("Miscellaneous"))
+        # Connect filter buttons to one shared slot, tagging each with its type
+        for btn, filter_type in ((self.all_btn, "All"),
+                                 (self.code_math_btn, "Code and Math"),
+                                 (self.url_btn, "URL"),
+                                 (self.plaintext_btn, "Plaintext"),
+                                 (self.misc_btn, "Miscellaneous")):
+            btn.setProperty("filter_type", filter_type)
+            btn.clicked.connect(self._on_filter_clicked)
         
         # Add buttons to sidebar
         sidebar_layout.addWidget(self.all_btn)
@@ -100,20 +125,7 @@ class ClipboardManager(QMainWindow):
         
         # Clear all button
         clear_btn = QPushButton("Clear All")
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                text-align: left;
-                padding: 10px;
-                font-size: 16px;
-                background-color: transparent;
-                color: #ECABF5;
-                border: 1px solid #ECABF5;
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background-color: #333;
-            }
-        """)
+        clear_btn.setObjectName("clearButton")
         clear_btn.clicked.connect(self.show_clear_popup)
         sidebar_layout.addWidget(clear_btn)
         
@@ -135,45 +147,37 @@ class ClipboardManager(QMainWindow):
         search_layout = QHBoxLayout()
         self.search_bar = QLineEdit()
         self.search_bar.setPlaceholderText("Search")
-        self.search_bar.setStyleSheet("""
-            QLineEdit {
-                background-color: #333;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 16px;
-            }
-        """)
-        self.search_bar.textChanged.connect(self.search_items)
+        self.search_bar.setStyleSheet(self.ui_components.SEARCH_BAR_STYLESHEET)
+        # Debounce typing so a burst of keystrokes triggers one search
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.search_items)
+        self.search_bar.textChanged.connect(self._search_timer.start)
+        # Enter skips the wait and searches right away
+        self.search_bar.returnPressed.connect(self._search_now)
         search_layout.addWidget(self.search_bar)
         content_layout.addLayout(search_layout)
         
         # Clipboard items area
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-            }
-            QScrollBar::handle:vertical {
-                border: 1px outset gray;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #dedede;
-            }
-            QScrollBar::handle:horizontal {
-                border: 1px outset gray;
-            }
-            QScrollBar::handle:horizontal:hover {
-                background-color: #dedede;
-            }
-        """)
-        
-        self.items_widget = QWidget()
-        self.items_layout = QVBoxLayout(self.items_widget)
-        self.items_layout.addStretch()
-        
-        scroll_area.setWidget(self.items_widget)
-        content_layout.addWidget(scroll_area)
+        self.items_view = QListView()
+        self.items_view.setModel(self.proxy_model)
+        self.items_view.setItemDelegate(ClipboardItemDelegate(self.items_view))
+        self.items_view.setResizeMode(QListView.Adjust)
+        # Rows have a fixed height, so only the viewport's rows are ever measured
+        self.items_view.setUniformItemSizes(True)
+        # Lay out rows in batches so loading or re-filtering a long history
+        # doesn't block the event loop for a single full layout pass
+        self.items_view.setLayoutMode(QListView.Batched)
+        self.items_view.setBatchSize(100)
+        self.items_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.items_view.setSelectionMode(QListView.NoSelection)
+        self.items_view.setMouseTracking(True)
+        # Rows show a cropped preview; double-click opens the full content
+        self.items_view.doubleClicked.connect(self.show_full_content)
+        self.items_view.setStyleSheet(self.ui_components.ITEMS_VIEW_STYLESHEET)
+        
+        content_layout.addWidget(self.items_view)
         
         return content_area
     
@@ -189,24 +193,75 @@ class ClipboardManager(QMainWindow):
         if result == QMessageBox.Ok:
             self.clear_clipboard_history()
     
+    def show_full_content(self, index):
+        """
+        Show the full content of a clipboard item in a read-only dialog.
+        
+        Args:
+            index (QModelIndex): Index of the item in the list view
+        """
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Clipboard Item")
+        dialog.resize(600, 400)
+        layout = QVBoxLayout(dialog)
+        
+        content = index.data(ClipboardItemModel.ContentRole)
+        
+        # QPlainTextEdit lays out only the visible lines, but wrapping a single
+        # very long line (e.g. a data URI) is quadratic, so don't wrap those
+        text_view = QPlainTextEdit()
+        text_view.setReadOnly(True)
+        if max(map(len, content.splitlines()), default=0) > self.MAX_WRAPPED_LINE:
+            text_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        text_view.setPlainText(content)
+        layout.addWidget(text_view)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.Close)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+        
+        dialog.exec_()
+    
     def add_clipboard_item(self, item):
         """
         Add new clipboard item to the top of the UI list.
         
+        While the window is hidden (e.g. in the tray) the item is only
+        queued; the list is updated in one batch the next time it is shown.
+        
         Args:
-            item (dict): Clipboard item to be added
+            item (ClipboardItem): Clipboard item to be added
         """
-        self.clipboard_items.insert(0, item)
-        self.data_manager.save_clipboard_data(self.clipboard_items)
-        item_widget = self.ui_components.create_clipboard_item(item)
-        self.items_layout.insertWidget(0, item_widget)
+        self.data_manager.queue_clipboard_item(item)
+        if not self.isVisible():
+            self._pending_items.append(item)
+            return
+        self.model.prepend_item(item)
     
     def display_clipboard_items(self):
-        """Render all clipboard items in memory to the UI."""
-        self.clear_items_layout()
-        for item in self.clipboard_items:
-            item_widget = self.ui_components.create_clipboard_item(item)
-            self.items_layout.insertWidget(0, item_widget)
+        """
+        Load the stored clipboard history into the list model.
+        
+        Only the most recent HISTORY_BATCH_SIZE items are loaded here; the
+        rest are appended by _load_history_batch on later event loop passes.
+        """
+        # Loading flushes the write queue, so the history already includes
+        # any items copied while the window was hidden
+        self._pending_items = []
+        items, self._history_key = self.data_manager.load_clipboard_page(self.HISTORY_BATCH_SIZE)
+        self.model.set_items(items)
+        if self._history_key is None:
+            self._history_timer.stop()
+        else:
+            self._history_timer.start()
+    
+    def _load_history_batch(self):
+        """Append the next page of older history to the list model."""
+        items, self._history_key = self.data_manager.load_clipboard_page(
+            self.HISTORY_BATCH_SIZE, self._history_key)
+        self.model.append_older_items(items)
+        if self._history_key is None:
+            self._history_timer.stop()
     
     def filter_items(self, filter_type):
         """
@@ -215,34 +270,41 @@ class ClipboardManager(QMainWindow):
         Args:
             filter_type (str): The type to filter by
         """
-        self.clear_items_layout()
-        for item in self.clipboard_items:
-            if filter_type == "All" or item["type"] == filter_type:
-                item_widget = self.ui_components.create_clipboard_item(item)
-                self.items_layout.insertWidget(0, item_widget)
+        self.proxy_model.set_filter_type(filter_type)
+    
+    def _on_filter_clicked(self):
+        """Apply the filter type stored on the sidebar button that was clicked."""
+        self.filter_items(self.sender().property("filter_type"))
     
     def search_items(self):
         """Filter items based on text entered in search bar."""
-        search_text = self.search_bar.text().lower()
-        self.clear_items_layout()
-        
-        for item in self.clipboard_items:
-            if search_text in item["content"].lower():
-                item_widget = self.ui_components.create_clipboard_item(item)
-                self.items_layout.insertWidget(0, item_widget)
+        self.proxy_model.set_search_text(self.search_bar.text())
     
-    def clear_items_layout(self):
-        """Clear all widgets from the items layout."""
-        while self.items_layout.count() > 1:
-            item = self.items_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    def _search_now(self):
+        """Run a pending debounced search immediately."""
+        if self._search_timer.isActive():
+            self._search_timer.stop()
+            self.search_items()
     
     def clear_clipboard_history(self):
         """Clear clipboard history."""
-        self.clipboard_items.clear()
-        self.clear_items_layout()
-        self.data_manager.save_clipboard_data(self.clipboard_items)
+        self._history_timer.stop()
+        self._history_key = None
+        self._pending_items = []
+        self.model.clear()
+        self.data_manager.clear_all_items()
+    
+    def showEvent(self, event):
+        """
+        Add items copied while the window was hidden before it is painted.
+        
+        Args:
+            event: QShowEvent triggered when the window is shown
+        """
+        if self._pending_items:
+            self.model.prepend_items(self._pending_items)
+            self._pending_items = []
+        super().showEvent(event)
     
     def closeEvent(self, event):
         """
@@ -256,6 +318,9 @@ class ClipboardManager(QMainWindow):
     
     def quit_application(self):
         """Handle application quit."""
-        self.data_manager.save_clipboard_data(self.clipboard_items)
         self.clipboard_monitor.stop_monitoring()
+        # Nothing may query the database once it is closed
+        self._history_timer.stop()
+        self._search_timer.stop()
+        self.data_manager.close()
         QApplication.quit() 
\ No newline at end of file
@@ -5,6 +5,21 @@ Content categorization utilities for clipboard items.
 import re
 
 
+# Patterns are compiled once at import time so each categorization is a
+# single pass of the regex engine per check instead of a cache lookup and
+# re-dispatch through the re module on every clipboard event.
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+# Alternatives start with different characters, so at most one can match at
+# any position and their order never changes the result. They are listed by
+# how often each tends to appear in copied code (Python first), so the
+# common ones are tried first.
+_CODE_RE = re.compile(r"(?:import |def |class |function |#include|public )")
+# Only the presence of an operator matters for a search, so the surrounding
+# [\d\w\s]* runs are dropped; they made long operator-free text quadratic.
+_MATH_RE = re.compile(r"[\^=+\-*/\\]")
+_SENTENCE_END_RE = re.compile(r"[.!?]$")
+
+
 class ContentCategorizer:
     """
     Handles categorization of clipboard content into different types.
@@ -26,24 +41,25 @@ class ContentCategorizer:
         
         content = str(content).strip()
         
-        # Check for empty content
-        if re.match(r"^\s*$", content):
+        # Check for empty content (all whitespace was just stripped)
+        if not content:
             return "Miscellaneous"
         
         # Check for URLs
-        if re.search(r"https?://\S+|www\.\S+", content):
+        if _URL_RE.search(content):
             return "URL"
         
         # Check for code patterns
-        if re.search(r"(def |function |public |class |#include|import )", content):
+        if _CODE_RE.search(content):
             return "Code and Math"
         
         # Check for math/code expressions (mathematical operators without sentence endings)
-        if re.search(r"[\d\w\s]*[\^=+\-*/\\]+[\d\w\s]*", content) and not re.search(r"[.!?]$", content):
+        ends_sentence = _SENTENCE_END_RE.search(content)
+        if _MATH_RE.search(content) and not ends_sentence:
             return "Code and Math"
         
         # Check if it's regular text (contains common sentence patterns)
-        if re.search(r"[.!?]$", content) or len(content.split()) > 3:
+        if ends_sentence or len(content.split()) > 3:
             return "Plaintext"
         
         # Default to miscellaneous for everything else